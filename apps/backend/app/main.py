@@ -1,7 +1,7 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-import os
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -13,7 +13,14 @@ load_dotenv(env_path)
 from app.routers import pipeline, edit, animate, agent_chat
 
 # Create FastAPI app
-app = FastAPI(title="Pixel Banana Suite API", version="1.0.0")
+app = FastAPI(
+    title="Pixel Banana Suite API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
+
+# Compress larger JSON payloads (job lists, batch results)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 # Configure CORS - MUST be before routers
 ALLOWED_ORIGINS = [
@@ -27,8 +34,10 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "authorization"],
+    # Let browsers cache preflight results so repeat POSTs skip the OPTIONS round-trip
+    max_age=86400,
 )
 
 # Include routers
@@ -38,6 +47,7 @@ app.include_router(animate.router)
 app.include_router(agent_chat.router)
 
 # Optional: Static file serving for artifacts
+# (from fastapi.staticfiles import StaticFiles when enabling)
 # app.mount("/view", StaticFiles(directory="assets/outputs"), name="view")
 
 @app.get("/")
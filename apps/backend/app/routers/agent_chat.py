@@ -13,7 +13,7 @@ class ChatRequest(BaseModel):
     intent: Optional[Literal["auto", "edit", "animate", "poses"]] = "auto"
 
 @router.post("/agent/chat")
-def chat(req: ChatRequest):
+async def chat(req: ChatRequest):
     """Process chat messages - stub implementation"""
     last_message = req.messages[-1].content if req.messages else "Hello"
     
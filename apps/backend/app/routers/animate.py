@@ -1,8 +1,6 @@
 from fastapi import APIRouter
 from pydantic import BaseModel
 from typing import List, Optional
-import time
-from pathlib import Path
 
 router = APIRouter()
 
@@ -16,19 +14,17 @@ class AnimateRequest(BaseModel):
     items: List[AnimateItemModel]
 
 @router.post("/animate")
-def animate(req: AnimateRequest):
+async def animate(req: AnimateRequest):
     """Create animations from frames - stub implementation"""
     results = []
     
     for item in req.items:
-        # Normalize Windows paths in frames
-        frames = [f.replace("\\", "/") for f in item.frames]
-        
+        # Stub only reports the frame count - no need to normalize each path
         result = {
             "sprite_sheet": f"assets/outputs/{item.basename}_sheet.png",
             "gif": f"assets/outputs/{item.basename}.gif",
             "basename": item.basename,
-            "frames_used": len(frames)
+            "frames_used": len(item.frames)
         }
         results.append(result)
     
@@ -1,7 +1,10 @@
-from fastapi import APIRouter, HTTPException
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import List, Any, Dict
-from app.services.nano_banana import NanoBanana, EditItem
+from app.services.nano_banana import NanoBanana, EditItem, get_nano_banana
+from app.utils.paths import to_posix
 
 router = APIRouter()
 
@@ -13,19 +16,22 @@ class EditRequest(BaseModel):
     items: List[EditItemModel]
 
 @router.post("/edit")
-def edit(req: EditRequest):
+async def edit(req: EditRequest, nb: NanoBanana = Depends(get_nano_banana)):
     """Process edit requests using Nano Banana"""
-    nb = NanoBanana()
-    results = []
-    
-    for item in req.items:
-        # Normalize Windows paths
-        normalized_path = item.image_path.replace("\\", "/")
-        edit_item = EditItem(
-            image_path=normalized_path,
+    edit_items = [
+        EditItem(
+            # Normalize Windows paths
+            image_path=to_posix(item.image_path),
             instruction=item.instruction
         )
-        result = nb.run_edit_stub(edit_item)
-        results.append(result)
+        for item in req.items
+    ]
+    
+    # Items are independent - fan them out instead of waiting on each in turn.
+    # Edits block (template load on first use, the Gemini/Comfy call once wired),
+    # so each one runs in the threadpool.
+    results = await asyncio.gather(
+        *(run_in_threadpool(nb.run_edit_stub, edit_item) for edit_item in edit_items)
+    )
     
-    return {"items": results}
\ No newline at end of file
+    return {"items": list(results)}
\ No newline at end of file
@@ -1,74 +1,127 @@
-from fastapi import APIRouter, Query
+import asyncio
+from fastapi import APIRouter, Query, Response
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from typing import List, Literal, Optional, Any, Dict
+from typing import List, Literal, Optional, Any, Dict, Iterator
 import time
 import os
+import orjson
+from functools import lru_cache
 from pathlib import Path
+from app.utils.paths import to_posix
 
 router = APIRouter(prefix="/pipeline", tags=["pipeline"])
 
+# Scanned roots - .env is loaded in main before routers import, so COMFY_OUT is resolved once here
+INPUTS_DIR = "assets/inputs"
+OUTPUTS_DIR = "assets/outputs"
+COMFY_OUT = os.getenv("COMFY_OUT", "C:/ComfyUI/outputs")
+
+# Upper bound on files counted per root so polling huge ComfyUI output trees stays cheap
+MAX_SCAN_FILES = 50000
+
+def _scandir_files(root: str) -> Iterator[os.DirEntry]:
+    """Yield file entries under root, recursively
+    
+    DirEntry caches the file type from readdir, so callers can classify and
+    stat each entry once. Unreadable subdirectories are skipped.
+    Symlinked files count as files (as Path.is_file() did), but symlinked
+    directories are not descended into, so link cycles can't loop the scan.
+    """
+    pending = [root]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError:
+            continue
+
+def _check_dir(path: str) -> Dict[str, Any]:
+    """Count files and find the newest mtime under path (blocking)"""
+    p = Path(path)
+    exists = p.exists() and p.is_dir()
+    file_count = 0
+    latest_mtime = None
+    truncated = False
+    
+    if exists:
+        for entry in _scandir_files(path):
+            if file_count >= MAX_SCAN_FILES:
+                truncated = True
+                break
+            try:
+                mtime = entry.stat().st_mtime
+            except OSError:
+                continue  # vanished between readdir and stat (ComfyUI cleanup)
+            file_count += 1
+            if latest_mtime is None or mtime > latest_mtime:
+                latest_mtime = mtime
+            
+    return {
+        "path": to_posix(path),
+        "exists": exists,
+        "file_count": file_count,
+        "latest_mtime": latest_mtime,
+        "truncated": truncated
+    }
+
 @router.get("/ping")
-def ping():
+async def ping():
     """Fast ping endpoint - no file operations"""
     return {"status": "ok"}
 
 @router.get("/roots")
-def roots():
-    """Get info about input/output/comfy directories"""
-    def check_dir(path: str) -> Dict[str, Any]:
-        p = Path(path)
-        exists = p.exists() and p.is_dir()
-        file_count = 0
-        latest_mtime = None
-        
-        if exists:
-            try:
-                files = list(p.glob("**/*"))
-                file_count = len([f for f in files if f.is_file()])
-                if file_count > 0:
-                    latest_mtime = max(f.stat().st_mtime for f in files if f.is_file())
-            except:
-                pass
-                
-        return {
-            "path": path.replace("\\", "/"),
-            "exists": exists,
-            "file_count": file_count,
-            "latest_mtime": latest_mtime
-        }
+async def roots():
+    """Get info about input/output/comfy directories
+    
+    Scans stop after MAX_SCAN_FILES files; `truncated` is set when the
+    count (and latest_mtime) only cover part of the tree.
+    """
+    # Directory walks block - scan the three roots concurrently off the event loop
+    inputs, outputs, comfy = await asyncio.gather(
+        run_in_threadpool(_check_dir, INPUTS_DIR),
+        run_in_threadpool(_check_dir, OUTPUTS_DIR),
+        run_in_threadpool(_check_dir, COMFY_OUT),
+    )
     
     return {
-        "inputs": check_dir("assets/inputs"),
-        "outputs": check_dir("assets/outputs"),
-        "comfy": check_dir(os.getenv("COMFY_OUT", "C:/ComfyUI/outputs"))
+        "inputs": inputs,
+        "outputs": outputs,
+        "comfy": comfy
     }
 
-@router.get("/status")
-def status(
-    limit: int = Query(25, ge=1, le=100),
-    include: Literal["all", "inputs", "outputs", "comfy"] = Query("all"),
-    resolve_urls: bool = Query(False)
-):
-    """Get recent jobs - returns stub data for now"""
-    now = int(time.time())
+@lru_cache(maxsize=64)
+def _build_status(count: int, resolve_urls: bool, include_files: bool, minute: int) -> bytes:
+    """Build the stub job list as JSON - pure function of its args, so it is memoized
+    
+    Cached as encoded bytes so every caller shares an immutable payload
+    (and repeat polls skip re-serialization). `include` isn't a key: the
+    stub returns the same jobs for every filter.
+    """
+    now = minute * 60
     items = []
     
-    for idx in range(min(limit, 8)):
+    for idx in range(count):
         job_time = now - (60 * (idx + 1))
         job_id = f"2025-09-07T{12-idx:02d}-34-56Z-demo"
         
         files = []
-        if idx % 2 == 0:
+        if include_files:
+            if idx % 2 == 0:
+                files.append({
+                    "kind": "sprite_sheet",
+                    "path": f"assets/outputs/demo_{idx}/sheet.png",
+                    "url": f"/view/demo_{idx}/sheet.png" if resolve_urls else None
+                })
             files.append({
-                "kind": "sprite_sheet",
-                "path": f"assets/outputs/demo_{idx}/sheet.png",
-                "url": f"/view/demo_{idx}/sheet.png" if resolve_urls else None
+                "kind": "gif",
+                "path": f"assets/outputs/demo_{idx}/anim.gif",
+                "url": f"/view/demo_{idx}/anim.gif" if resolve_urls else None
             })
-        files.append({
-            "kind": "gif",
-            "path": f"assets/outputs/demo_{idx}/anim.gif",
-            "url": f"/view/demo_{idx}/anim.gif" if resolve_urls else None
-        })
         
         items.append({
             "job_id": job_id,
@@ -78,7 +131,23 @@ def status(
             "files": files
         })
     
-    return items
+    return orjson.dumps(items)
+
+@router.get("/status")
+async def status(
+    limit: int = Query(25, ge=1, le=100),
+    include: Literal["all", "inputs", "outputs", "comfy"] = Query("all"),
+    resolve_urls: bool = Query(False),
+    include_files: bool = Query(True)
+):
+    """Get recent jobs - returns stub data for now
+    
+    Pollers that only need job ids/timestamps can pass include_files=false
+    to skip the per-job file listing (`files` is then empty).
+    """
+    # Stub only has 8 demo jobs; timestamps are truncated to the minute so UI polls hit the cache
+    payload = _build_status(min(limit, 8), resolve_urls, include_files, int(time.time()) // 60)
+    return Response(content=payload, media_type="application/json")
 
 class PoseSpec(BaseModel):
     name: str
@@ -91,10 +160,10 @@ class PosesRequest(BaseModel):
     out_dir: Optional[str] = "assets/outputs"
 
 @router.post("/poses")
-def poses(req: PosesRequest):
+async def poses(req: PosesRequest):
     """Generate poses from sprite - stub implementation"""
     # Normalize Windows paths
-    image_path = req.image_path.replace("\\", "/")
+    image_path = to_posix(req.image_path)
     base = Path(image_path).stem
     job_id = f"poses-{int(time.time())}-{base}"
     
@@ -1,21 +1,37 @@
 from __future__ import annotations
+import json
 import os
 import time
+import uuid
 import requests
-from typing import Any, Dict, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Any, Dict, Optional, Tuple
 
 class ComfyClient:
     def __init__(self, base_url: Optional[str] = None, timeout: int = 120):
         self.base_url = (base_url or os.getenv("COMFY_BASE") or "http://127.0.0.1:8188").rstrip("/")
         self.session = requests.Session()
+        # Keep-alive pool sized for concurrent jobs; retry connect errors (any
+        # method - nothing was sent yet) and 502/503/504 on GETs. Status/read
+        # errors on POST /prompt are not retried, so a workflow is never queued twice
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504]),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self.timeout = timeout
+        # ComfyUI routes execution events to the websocket with this id
+        self.client_id = uuid.uuid4().hex
 
     def submit(self, workflow: Dict[str, Any]) -> str:
         """Submit workflow to ComfyUI"""
         try:
             r = self.session.post(
                 f"{self.base_url}/prompt", 
-                json={"prompt": workflow}, 
+                json={"prompt": workflow, "client_id": self.client_id}, 
                 timeout=30
             )
             r.raise_for_status()
@@ -25,25 +41,112 @@ class ComfyClient:
             print(f"ComfyUI submit error: {e}")
             return ""
 
+    def _fetch_history(self, prompt_id: str) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """GET /history once; return (entry if the prompt has finished, raw response)"""
+        r = self.session.get(f"{self.base_url}/history/{prompt_id}", timeout=20)
+        if r.status_code != 200:
+            return None, None
+        data = r.json()
+        if prompt_id in data:
+            status = data[prompt_id].get("status", {})
+            if status.get("status_str") in ["success", "error"]:
+                return data[prompt_id], data
+        return None, data
+
+    def wait_ws(self, prompt_id: str, deadline: float, interval: float = 1.0) -> Optional[Dict[str, Any]]:
+        """Sleep on the ComfyUI websocket until prompt_id finishes or deadline passes
+        
+        /history is checked once up front, then only when the socket has been
+        quiet (or busy with other prompts' events) for a full interval*5
+        slice - never per message, so progress/preview traffic costs no GETs.
+        A silent socket therefore degrades to slow polling, not a blind wait.
+        Returns the history entry if it saw the prompt finish, else None
+        (websocket-client missing, socket error, final event seen before the
+        history write, or deadline reached) - callers then poll over HTTP.
+        """
+        try:
+            import websocket  # websocket-client
+        except ImportError:
+            return None
+        
+        # http:// -> ws://, https:// -> wss://
+        ws_url = f"ws{self.base_url[4:]}/ws?clientId={self.client_id}"
+        try:
+            ws = websocket.create_connection(ws_url, timeout=10)
+        except Exception as e:
+            print(f"ComfyUI websocket error: {e}")
+            return None
+        
+        slice_s = interval * 5
+        try:
+            # The prompt may have finished before we subscribed
+            entry, _ = self._fetch_history(prompt_id)
+            if entry is not None:
+                return entry
+            next_check = time.time() + slice_s
+            
+            while time.time() < deadline:
+                if time.time() >= next_check:
+                    entry, _ = self._fetch_history(prompt_id)
+                    if entry is not None:
+                        return entry
+                    next_check = time.time() + slice_s
+                
+                ws.settimeout(max(min(next_check, deadline) - time.time(), 0.1))
+                try:
+                    msg = ws.recv()
+                except websocket.WebSocketTimeoutException:
+                    continue  # slice elapsed - re-check history at the loop top
+                if not isinstance(msg, str):
+                    continue  # binary preview frames
+                event = json.loads(msg)
+                data = event.get("data") or {}
+                if data.get("prompt_id") != prompt_id:
+                    continue
+                if event.get("type") == "executing" and data.get("node") is None:
+                    return None  # history is written just after this event
+                if event.get("type") == "execution_error":
+                    return None
+        except Exception as e:
+            print(f"ComfyUI websocket error: {e}")
+        finally:
+            ws.close()
+        
+        return None
+
     def poll(self, prompt_id: str, interval: float = 1.0, max_wait: float = 300.0) -> Dict[str, Any]:
-        """Poll for workflow completion"""
-        start = time.time()
+        """Poll for workflow completion
+        
+        Not safe to call concurrently for two prompts on one ComfyClient:
+        ComfyUI keeps one socket per clientId, so a second wait_ws replaces
+        the first waiter's socket. That waiter still finishes via its
+        /history re-checks, just at websocket-slice latency. Use one client
+        per concurrently polled prompt.
+        """
+        deadline = time.time() + max_wait
         last_response = None
         
-        while time.time() - start < max_wait:
+        # Sleep on the websocket instead of hammering /history, sharing this
+        # poll's budget; the HTTP loop below picks up the result or takes over
+        entry = self.wait_ws(prompt_id, deadline, interval=interval)
+        if entry is not None:
+            return entry
+        
+        # Always check history at least once before reporting a timeout
+        while True:
             try:
-                r = self.session.get(f"{self.base_url}/history/{prompt_id}", timeout=20)
-                if r.status_code == 200:
-                    data = r.json()
-                    if prompt_id in data:
-                        status = data[prompt_id].get("status", {})
-                        if status.get("status_str") in ["success", "error"]:
-                            return data[prompt_id]
+                entry, data = self._fetch_history(prompt_id)
+                if entry is not None:
+                    return entry
+                if data is not None:
                     last_response = data
             except Exception as e:
                 print(f"Poll error: {e}")
             
-            time.sleep(interval)
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            time.sleep(min(interval, remaining))
         
         return {"status": "timeout", "last": last_response}
 
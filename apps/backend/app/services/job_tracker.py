@@ -1,6 +1,9 @@
 from typing import Dict, List, Any, Optional
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice
+import threading
 import time
 import uuid
 
@@ -16,55 +19,64 @@ class Job:
 
 class JobTracker:
     def __init__(self):
-        self.jobs: Dict[str, Job] = {}
+        # Kept in updated_at order (oldest first): update_job moves a job to
+        # the end, so recent-job queries just walk the dict backwards
+        self.jobs: "OrderedDict[str, Job]" = OrderedDict()
+        # Guards jobs against concurrent handlers/Comfy callbacks in worker threads
+        self._lock = threading.RLock()
         
     def create_job(self, source: str = "api", metadata: Optional[Dict] = None) -> str:
         """Create a new job"""
-        job_id = f"{source}-{int(time.time())}-{uuid.uuid4().hex[:8]}"
-        now = time.time()
-        
-        job = Job(
-            job_id=job_id,
-            source=source,
-            created_at=now,
-            updated_at=now,
-            metadata=metadata or {}
-        )
-        
-        self.jobs[job_id] = job
+        with self._lock:
+            # Timestamp under the lock so insertion order matches updated_at order
+            now = time.time()
+            job_id = f"{source}-{int(now)}-{uuid.uuid4().hex[:8]}"
+            
+            job = Job(
+                job_id=job_id,
+                source=source,
+                created_at=now,
+                updated_at=now,
+                metadata=metadata or {}
+            )
+            
+            self.jobs[job_id] = job
         return job_id
     
     def update_job(self, job_id: str, status: Optional[str] = None, 
                    files: Optional[List[Dict]] = None) -> bool:
         """Update job status and/or files"""
-        if job_id not in self.jobs:
-            return False
-        
-        job = self.jobs[job_id]
-        job.updated_at = time.time()
-        
-        if status:
-            job.status = status
-        if files:
-            job.files.extend(files)
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return False
+            
+            job.updated_at = time.time()
+            # Reorder in place - the key never leaves the dict, so lock-free get_job stays safe
+            self.jobs.move_to_end(job_id)
+            
+            if status:
+                job.status = status
+            if files:
+                job.files.extend(files)
         
         return True
     
     def get_job(self, job_id: str) -> Optional[Job]:
         """Get a specific job"""
+        # Single dict lookup is atomic - no lock needed
         return self.jobs.get(job_id)
     
     def get_recent_jobs(self, limit: int = 10, source: Optional[str] = None) -> List[Job]:
         """Get recent jobs, optionally filtered by source"""
-        jobs = list(self.jobs.values())
-        
-        if source:
-            jobs = [j for j in jobs if j.source == source]
-        
-        # Sort by updated_at descending
-        jobs.sort(key=lambda x: x.updated_at, reverse=True)
-        
-        return jobs[:limit]
+        with self._lock:
+            # Newest first - no sort needed, stops after `limit` matches
+            jobs = reversed(self.jobs.values())
+            
+            if source:
+                jobs = (j for j in jobs if j.source == source)
+            
+            return list(islice(jobs, limit))
 
 # Global instance
 job_tracker = JobTracker()
\ No newline at end of file
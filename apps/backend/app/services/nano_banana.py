@@ -1,7 +1,8 @@
 from __future__ import annotations
 import os
 from dataclasses import dataclass
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
 @dataclass
@@ -9,6 +10,42 @@ class EditItem:
     image_path: str
     instruction: str
 
+@lru_cache(maxsize=8)
+def _load_templates(prompts_dir: str) -> Dict[str, str]:
+    """Read system/user templates - they don't change while the process runs"""
+    base = Path(prompts_dir)
+    templates = {}
+    
+    # Try to load system prompt
+    system_path = base / "system.md"
+    if system_path.exists():
+        templates["system"] = system_path.read_text(encoding="utf-8")
+    else:
+        templates["system"] = (
+            "You are Nano Banana, a careful pixel-art editor. "
+            "Apply sprite-safe changes, keep silhouettes intact, avoid blurring. "
+            "Return concise directives; never include unsafe or destructive edits."
+        )
+    
+    # Try to load instruction template
+    instruction_path = base / "instruction.md"
+    if instruction_path.exists():
+        templates["user"] = instruction_path.read_text(encoding="utf-8")
+    else:
+        templates["user"] = (
+            "Instruction: {{instruction}}\n"
+            "Requirements: preserve pixel density, avoid global blur, keep character proportions.\n"
+            "Output: list the concrete edits/tool steps."
+        )
+    
+    return templates
+
+@lru_cache(maxsize=8)
+def _prompt_parts(prompts_dir: str) -> Tuple[str, Tuple[str, ...]]:
+    """System prompt plus the user template pre-split on {{instruction}}"""
+    templates = _load_templates(prompts_dir)
+    return templates["system"], tuple(templates["user"].split("{{instruction}}"))
+
 class NanoBanana:
     def __init__(self, prompts_dir: str = None):
         if prompts_dir is None:
@@ -17,39 +54,15 @@ class NanoBanana:
         self.gemini_key = os.getenv("GEMINI_API_KEY")
 
     def load_templates(self) -> Dict[str, str]:
-        """Load prompt templates"""
-        templates = {}
-        
-        # Try to load system prompt
-        system_path = self.prompts_dir / "system.md"
-        if system_path.exists():
-            templates["system"] = system_path.read_text(encoding="utf-8")
-        else:
-            templates["system"] = (
-                "You are Nano Banana, a careful pixel-art editor. "
-                "Apply sprite-safe changes, keep silhouettes intact, avoid blurring. "
-                "Return concise directives; never include unsafe or destructive edits."
-            )
-        
-        # Try to load instruction template
-        instruction_path = self.prompts_dir / "instruction.md"
-        if instruction_path.exists():
-            templates["user"] = instruction_path.read_text(encoding="utf-8")
-        else:
-            templates["user"] = (
-                "Instruction: {{instruction}}\n"
-                "Requirements: preserve pixel density, avoid global blur, keep character proportions.\n"
-                "Output: list the concrete edits/tool steps."
-            )
-        
-        return templates
+        """Load prompt templates (read from disk once per prompts_dir)"""
+        return dict(_load_templates(str(self.prompts_dir)))
 
     def build_prompt(self, item: EditItem) -> str:
         """Build the full prompt for editing"""
-        templates = self.load_templates()
-        user_prompt = templates["user"].replace("{{instruction}}", item.instruction)
+        system, user_parts = _prompt_parts(str(self.prompts_dir))
+        user_prompt = item.instruction.join(user_parts)
         
-        return f"{templates['system']}\n\n{user_prompt}"
+        return f"{system}\n\n{user_prompt}"
 
     def run_edit_stub(self, item: EditItem) -> Dict[str, Any]:
         """Stub implementation - returns mock result"""
@@ -69,4 +82,17 @@ class NanoBanana:
                 "note": "Stub edit complete - wire to real Gemini/Comfy pipeline",
                 "edited_path": f"assets/outputs/edited_{Path(item.image_path).stem}.png"
             }
-        }
\ No newline at end of file
+        }
+
+_nano_banana: Optional[NanoBanana] = None
+
+async def get_nano_banana() -> NanoBanana:
+    """Shared NanoBanana instance, reused across requests
+    
+    async so FastAPI resolves the dependency on the event loop instead of a
+    threadpool hop per request; created lazily, after main has loaded .env.
+    """
+    global _nano_banana
+    if _nano_banana is None:
+        _nano_banana = NanoBanana()
+    return _nano_banana
\ No newline at end of file
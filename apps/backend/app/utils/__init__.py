@@ -0,0 +1 @@
+# Utils package initialization
\ No newline at end of file
@@ -0,0 +1,3 @@
+def to_posix(path: str) -> str:
+    """Normalize Windows separators to forward slashes"""
+    return path.replace("\\", "/")
\ No newline at end of file
@@ -3,17 +3,35 @@ import os
 import argparse
 import requests
 import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 API_BASE = os.getenv('API_BASE', 'http://127.0.0.1:8000')
 
-def main():
+# Shared keep-alive session so in-process callers looping over main() reuse one connection.
+# POST is opted into status retries (urllib3 skips it by default) - /animate is idempotent.
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({'GET', 'POST'}),
+    ),
+)
+_SESSION.mount('http://', _adapter)
+_SESSION.mount('https://', _adapter)
+
+def main(argv=None):
     parser = argparse.ArgumentParser(description='Create animations from frames')
     parser.add_argument('--frames', nargs='+', required=True, help='Frame paths')
     parser.add_argument('--basename', required=True, help='Output basename')
     parser.add_argument('--fps', type=int, default=8, help='Frames per second')
     parser.add_argument('--cols', type=int, default=4, help='Sprite sheet columns')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     payload = {
         'items': [{
@@ -28,7 +46,7 @@ def main():
     print(f'Animating {len(args.frames)} frames')
     
     try:
-        response = requests.post(
+        response = _SESSION.post(
             f'{API_BASE}/animate',
             json=payload,
             timeout=60
@@ -23,6 +23,7 @@ export interface RootInfo {
   exists: boolean
   file_count: number
   latest_mtime: number | null
+  truncated: boolean
 }
 
 export interface Roots {